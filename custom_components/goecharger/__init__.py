@@ -1,7 +1,9 @@
 """go-eCharger integration"""
+import asyncio
 import voluptuous as vol
 import ipaddress
 import logging
+import math
 from datetime import timedelta
 import homeassistant.helpers.config_validation as cv
 from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL
@@ -22,6 +24,16 @@ CHARGE_LIMIT = "charge_limit"
 SET_MAX_CURRENT_ATTR = "max_current"
 CHARGER_NAME_ATTR = "charger_name"
 
+MIN_CURRENT = 6
+MAX_CURRENT = 32
+
+# indexed by the numeric cable_lock_mode service value
+CABLE_LOCK_MODES = (
+    GoeCharger.CableLockMode.UNLOCKCARFIRST,
+    GoeCharger.CableLockMode.AUTOMATIC,
+    GoeCharger.CableLockMode.LOCKED,
+)
+
 MIN_UPDATE_INTERVAL = timedelta(seconds=10)
 DEFAULT_UPDATE_INTERVAL = timedelta(seconds=20)
 
@@ -74,6 +86,100 @@ async def async_unload_entry(hass, entry):
     return True
 
 
+def _service_value(hass, value):
+    """Return a service argument as number; entity ids are resolved to their state.
+
+    Returns None if the value (or the entity state, e.g. 'unavailable') is not a finite number.
+    """
+    if not isinstance(value, str):
+        return value
+    # numbers like '2.5' also pass valid_entity_id, so only resolve existing entities
+    state = hass.states.get(value) if valid_entity_id(value) else None
+    if state is not None:
+        value = state.state
+    try:
+        value = float(value)
+    except ValueError:
+        return None
+    # float() also accepts 'nan' and 'inf', which int() and the chargers can't handle
+    return value if math.isfinite(value) else None
+
+
+def _target_chargers(hass, chargerNameInput):
+    """Return the names of the chargers a service call applies to (all if no name is given)."""
+    chargerApi = hass.data[DOMAIN]["api"]
+    if len(chargerNameInput) > 0:
+        if chargerNameInput not in chargerApi:
+            _LOGGER.error("Charger with name '%s' not found!", chargerNameInput)
+            return []
+        return [chargerNameInput]
+    return list(chargerApi.keys())
+
+
+def _async_store_reply(hass, chargerName, status):
+    """Store the status a charger answered a write with in the coordinator data.
+
+    Returns False if the answer holds no usable status.
+    """
+    if status.get("car_status", "unknown") == "unknown":
+        return False
+    coordinator = hass.data[DOMAIN]["coordinator"]
+    if coordinator.data is None:
+        coordinator.data = {}
+    coordinator.data[chargerName] = status
+    # the answer is as good as a successful poll, so the entities become available again
+    coordinator.last_update_success = True
+    # polls started before this write must not overwrite the newer answer
+    writes = hass.data[DOMAIN]["writes"]
+    writes[chargerName] = writes.get(chargerName, 0) + 1
+    return True
+
+
+def _async_update_listeners(coordinator):
+    """Update the coordinator entities without resetting the poll schedule."""
+    if hasattr(coordinator, "async_update_listeners"):
+        coordinator.async_update_listeners()
+        return
+    # Home Assistant before 2022.7 has no public method for this
+    for update_callback in list(coordinator._listeners):
+        update_callback()
+
+
+async def _async_set_on_chargers(hass, chargerNames, setter, value):
+    """Call the api setter with the same value on all given chargers concurrently.
+
+    The setters answer with the charger status after the change, which is stored in the
+    coordinator data directly instead of polling all chargers again.
+    """
+    if not chargerNames:
+        return
+    chargerApi = hass.data[DOMAIN]["api"]
+    coordinator = hass.data[DOMAIN]["coordinator"]
+    for chargerName in chargerNames:
+        _LOGGER.debug("%s for charger '%s' to %s", setter, chargerName, value)
+    # one unreachable charger must not drop the answers of the others
+    statuses = await asyncio.gather(*[
+        hass.async_add_executor_job(getattr(chargerApi[chargerName], setter), value)
+        for chargerName in chargerNames
+    ], return_exceptions=True)
+    updated = False
+    refresh = False
+    for chargerName, status in zip(chargerNames, statuses):
+        if isinstance(status, Exception):
+            _LOGGER.error("%s for charger '%s' failed: %s", setter, chargerName, status)
+            refresh = True
+        elif _async_store_reply(hass, chargerName, status):
+            updated = True
+        else:
+            # no usable status in the answer, fall back to polling
+            refresh = True
+    if updated:
+        # async_set_updated_data would also reset the poll schedule of all chargers
+        _async_update_listeners(coordinator)
+    if refresh:
+        await coordinator.async_request_refresh()
+
+
 class ChargerStateFetcher:
     def __init__(self, hass):
         self._hass = hass
@@ -81,14 +187,25 @@ class ChargerStateFetcher:
     async def fetch_states(self):
         _LOGGER.debug('Updating status...')
         goeChargers = self._hass.data[DOMAIN]["api"]
+        writes = self._hass.data[DOMAIN]["writes"]
+        chargerNames = list(goeChargers.keys())
+        writesBefore = dict(writes)
+        # query all chargers at once so one tick takes as long as the slowest charger
+        fetchedStatuses = await asyncio.gather(*[
+            self._hass.async_add_executor_job(goeChargers[chargerName].requestStatus)
+            for chargerName in chargerNames
+        ])
+        # read after polling to keep the answers of writes that finished meanwhile
         data = self.coordinator.data if self.coordinator.data else {}
-        for chargerName in goeChargers.keys():
-            _LOGGER.debug(f"update for '{chargerName}'..")
-            fetchedStatus = await self._hass.async_add_executor_job(goeChargers[chargerName].requestStatus)
-            if fetchedStatus.get("car_status", "unknown") != "unknown":
+        for chargerName, fetchedStatus in zip(chargerNames, fetchedStatuses):
+            _LOGGER.debug("update for '%s'..", chargerName)
+            if writes.get(chargerName, 0) != writesBefore.get(chargerName, 0):
+                # written to while polling, the answer of the write is newer
+                _LOGGER.debug("discarding status of '%s' polled before a write", chargerName)
+            elif fetchedStatus.get("car_status", "unknown") != "unknown":
                 data[chargerName] = fetchedStatus
             else:
-                _LOGGER.error(f"Unable to fetch state for Charger {chargerName}")
+                _LOGGER.error("Unable to fetch state for Charger %s", chargerName)
         return data
 
 
@@ -112,7 +229,8 @@ async def async_setup(hass: core.HomeAssistant, config: dict) -> bool:
         if host:
             if not serial:
                 goeCharger = GoeCharger(host)
-                status = goeCharger.requestStatus()
+                # blocking http request, keep it off the event loop
+                status = await hass.async_add_executor_job(goeCharger.requestStatus)
                 serial = status["serial_number"]
             chargers.append([{CONF_NAME: serial, CONF_HOST: host}])
         _LOGGER.debug(repr(chargers))
@@ -126,6 +244,8 @@ async def async_setup(hass: core.HomeAssistant, config: dict) -> bool:
             chargerApi[chargerName] = goeCharger
 
     hass.data[DOMAIN]["api"] = chargerApi
+    # number of stored write answers per charger, see _async_store_reply
+    hass.data[DOMAIN]["writes"] = {}
 
     chargeStateFecher = ChargerStateFetcher(hass)
 
@@ -147,169 +267,75 @@ async def async_setup(hass: core.HomeAssistant, config: dict) -> bool:
         chargerNameInput = call.data.get(CHARGER_NAME_ATTR, '')
 
         maxCurrentInput = call.data.get(
-            SET_MAX_CURRENT_ATTR, 32  # TODO: dynamic based on chargers absolute_max-setting
+            SET_MAX_CURRENT_ATTR, MAX_CURRENT  # TODO: dynamic based on chargers absolute_max-setting
         )
-        maxCurrent = 0
-        if isinstance(maxCurrentInput, str):
-            if maxCurrentInput.isnumeric():
-                maxCurrent = int(maxCurrentInput)
-            elif valid_entity_id(maxCurrentInput):
-                maxCurrent = int(hass.states.get(maxCurrentInput).state)
-            else:
-                _LOGGER.error(
-                    "No valid value for '%s': %s", SET_MAX_CURRENT_ATTR, maxCurrent
-                )
-                return
-        else:
-            maxCurrent = maxCurrentInput
-
-        if maxCurrent < 6:
-            maxCurrent = 6
-        if maxCurrent > 32:
-            maxCurrent = 32
+        maxCurrent = _service_value(hass, maxCurrentInput)
+        if maxCurrent is None:
+            _LOGGER.error(
+                "No valid value for '%s': %s", SET_MAX_CURRENT_ATTR, maxCurrentInput
+            )
+            return
 
-        if len(chargerNameInput) > 0:
-            _LOGGER.debug(f"set max_current for charger '{chargerNameInput}' to {maxCurrent}")
-            try:
-                await hass.async_add_executor_job(hass.data[DOMAIN]["api"][chargerNameInput].setMaxCurrent, maxCurrent)
-            except KeyError:
-                _LOGGER.error(f"Charger with name '{chargerName}' not found!")
+        maxCurrent = max(MIN_CURRENT, min(MAX_CURRENT, int(maxCurrent)))
 
-        else:
-            for charger in hass.data[DOMAIN]["api"].keys():
-                try:
-                    _LOGGER.debug(f"set max_current for charger '{charger}' to {maxCurrent}")
-                    await hass.async_add_executor_job(hass.data[DOMAIN]["api"][charger].setMaxCurrent, maxCurrent)
-                except KeyError:
-                    _LOGGER.error(f"Charger with name '{chargerName}' not found!")
-
-        await hass.data[DOMAIN]["coordinator"].async_refresh()
+        await _async_set_on_chargers(
+            hass, _target_chargers(hass, chargerNameInput), "setMaxCurrent", maxCurrent
+        )
 
     async def async_handle_set_absolute_max_current(call):
         """Handle the service call to set the absolute max current."""
         chargerNameInput = call.data.get(CHARGER_NAME_ATTR, '')
         absoluteMaxCurrentInput = call.data.get(SET_ABSOLUTE_MAX_CURRENT_ATTR, 16)
-        if isinstance(absoluteMaxCurrentInput, str):
-            if absoluteMaxCurrentInput.isnumeric():
-                absoluteMaxCurrent = int(absoluteMaxCurrentInput)
-            elif valid_entity_id(absoluteMaxCurrentInput):
-                absoluteMaxCurrent = int(hass.states.get(absoluteMaxCurrentInput).state)
-            else:
-                _LOGGER.error(
-                    "No valid value for '%s': %s",
-                    SET_ABSOLUTE_MAX_CURRENT_ATTR,
-                    absoluteMaxCurrentInput,
-                )
-                return
-        else:
-            absoluteMaxCurrent = absoluteMaxCurrentInput
-
-        if absoluteMaxCurrent < 6:
-            absoluteMaxCurrent = 6
-        if absoluteMaxCurrent > 32:
-            absoluteMaxCurrent = 32
-
-        if len(chargerNameInput) > 0:
-            _LOGGER.debug(f"set absolute_max_current for charger '{chargerNameInput}' to {absoluteMaxCurrent}")
-            try:
-                await hass.async_add_executor_job(
-                    hass.data[DOMAIN]["api"][chargerNameInput].setAbsoluteMaxCurrent, absoluteMaxCurrent
-                )
-            except KeyError:
-                _LOGGER.error(f"Charger with name '{chargerName}' not found!")
-
-        else:
-            for charger in hass.data[DOMAIN]["api"].keys():
-                try:
-                    _LOGGER.debug(f"set absolute_max_current for charger '{charger}' to {absoluteMaxCurrent}")
-                    await hass.async_add_executor_job(
-                        hass.data[DOMAIN]["api"][charger].setAbsoluteMaxCurrent, absoluteMaxCurrent
-                    )
-                except KeyError:
-                    _LOGGER.error(f"Charger with name '{chargerName}' not found!")
-
-        await hass.data[DOMAIN]["coordinator"].async_refresh()
+        absoluteMaxCurrent = _service_value(hass, absoluteMaxCurrentInput)
+        if absoluteMaxCurrent is None:
+            _LOGGER.error(
+                "No valid value for '%s': %s",
+                SET_ABSOLUTE_MAX_CURRENT_ATTR,
+                absoluteMaxCurrentInput,
+            )
+            return
+
+        absoluteMaxCurrent = max(MIN_CURRENT, min(MAX_CURRENT, int(absoluteMaxCurrent)))
+
+        await _async_set_on_chargers(
+            hass, _target_chargers(hass, chargerNameInput), "setAbsoluteMaxCurrent", absoluteMaxCurrent
+        )
 
     async def async_handle_set_cable_lock_mode(call):
         """Handle the service call to set the absolute max current."""
         chargerNameInput = call.data.get(CHARGER_NAME_ATTR, '')
         cableLockModeInput = call.data.get(SET_CABLE_LOCK_MODE_ATTR, 0)
-        if isinstance(cableLockModeInput, str):
-            if cableLockModeInput.isnumeric():
-                cableLockMode = int(cableLockModeInput)
-            elif valid_entity_id(cableLockModeInput):
-                cableLockMode = int(hass.states.get(cableLockModeInput).state)
-            else:
-                _LOGGER.error(
-                    "No valid value for '%s': %s",
-                    SET_CABLE_LOCK_MODE_ATTR,
-                    cableLockModeInput,
-                )
-                return
-        else:
-            cableLockMode = cableLockModeInput
-
-        cableLockModeEnum = GoeCharger.CableLockMode.UNLOCKCARFIRST
-        if cableLockModeInput == 1:
-            cableLockModeEnum = GoeCharger.CableLockMode.AUTOMATIC
-        if cableLockMode >= 2:
-            cableLockModeEnum = GoeCharger.CableLockMode.LOCKED
-
-        if len(chargerNameInput) > 0:
-            _LOGGER.debug(f"set set_cable_lock_mode for charger '{chargerNameInput}' to {cableLockModeEnum}")
-            try:
-                await hass.async_add_executor_job(
-                    hass.data[DOMAIN]["api"][chargerNameInput].setCableLockMode, cableLockModeEnum
-                )
-            except KeyError:
-                _LOGGER.error(f"Charger with name '{chargerName}' not found!")
-
-        else:
-            for charger in hass.data[DOMAIN]["api"].keys():
-                try:
-                    _LOGGER.debug(f"set set_cable_lock_mode for charger '{charger}' to {cableLockModeEnum}")
-                    await hass.async_add_executor_job(hass.data[DOMAIN]["api"][charger].setCableLockMode, cableLockModeEnum)
-                except KeyError:
-                    _LOGGER.error(f"Charger with name '{chargerName}' not found!")
-
-        await hass.data[DOMAIN]["coordinator"].async_refresh()
+        cableLockMode = _service_value(hass, cableLockModeInput)
+        if cableLockMode is None:
+            _LOGGER.error(
+                "No valid value for '%s': %s",
+                SET_CABLE_LOCK_MODE_ATTR,
+                cableLockModeInput,
+            )
+            return
+
+        cableLockModeEnum = CABLE_LOCK_MODES[max(0, min(len(CABLE_LOCK_MODES) - 1, int(cableLockMode)))]
+
+        await _async_set_on_chargers(
+            hass, _target_chargers(hass, chargerNameInput), "setCableLockMode", cableLockModeEnum
+        )
 
     async def async_handle_set_charge_limit(call):
         """Handle the service call to set charge limit."""
         chargerNameInput = call.data.get(CHARGER_NAME_ATTR, '')
         chargeLimitInput = call.data.get(CHARGE_LIMIT, 0.0)
-        if isinstance(chargeLimitInput, str):
-            if chargeLimitInput.isnumeric():
-                chargeLimit = float(chargeLimitInput)
-            elif valid_entity_id(chargeLimitInput):
-                chargeLimit = float(hass.states.get(chargeLimitInput).state)
-            else:
-                _LOGGER.error(
-                    "No valid value for '%s': %s", CHARGE_LIMIT, chargeLimitInput
-                )
-                return
-        else:
-            chargeLimit = chargeLimitInput
-
-        if chargeLimit < 0:
-            chargeLimit = 0
+        chargeLimit = _service_value(hass, chargeLimitInput)
+        if chargeLimit is None:
+            _LOGGER.error(
+                "No valid value for '%s': %s", CHARGE_LIMIT, chargeLimitInput
+            )
+            return
 
-        if len(chargerNameInput) > 0:
-            _LOGGER.debug(f"set set_charge_limit for charger '{chargerNameInput}' to {chargeLimit}")
-            try:
-                await hass.async_add_executor_job(hass.data[DOMAIN]["api"][chargerNameInput].setChargeLimit, chargeLimit)
-            except KeyError:
-                _LOGGER.error(f"Charger with name '{chargerName}' not found!")
+        chargeLimit = max(0, chargeLimit)
 
-        else:
-            for charger in hass.data[DOMAIN]["api"].keys():
-                try:
-                    _LOGGER.debug(f"set set_charge_limit for charger '{charger}' to {chargeLimit}")
-                    await hass.async_add_executor_job(hass.data[DOMAIN]["api"][charger].setChargeLimit, chargeLimit)
-                except KeyError:
-                    _LOGGER.error(f"Charger with name '{chargerName}' not found!")
-
-        await hass.data[DOMAIN]["coordinator"].async_refresh()
+        await _async_set_on_chargers(
+            hass, _target_chargers(hass, chargerNameInput), "setChargeLimit", chargeLimit
+        )
 
     hass.services.async_register(DOMAIN, "set_max_current", async_handle_set_max_current)
     hass.services.async_register(
@@ -6,6 +6,7 @@ from homeassistant.const import (
 )
 
 from homeassistant import core, config_entries
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import (
     STATE_CLASS_TOTAL_INCREASING,
@@ -120,19 +121,30 @@ _sensors = [
 ]
 
 
+# (attribute, name, unit, state class, device class) per sensor; resolved once
+# at import instead of for every charger that gets set up
+_sensorDescriptions = [
+    (
+        sensor,
+        _sensorUnits.get(sensor, {}).get('name', sensor),
+        _sensorUnits.get(sensor, {}).get('unit', ''),
+        _sensorStateClass.get(sensor, ''),
+        _sensorDeviceClass.get(sensor, ''),
+    )
+    for sensor in _sensors
+]
+
+
 def _create_sensors_for_charger(chargerName, hass):
     entities = []
+    coordinator = hass.data[DOMAIN]["coordinator"]
 
-    for sensor in _sensors:
+    for sensor, sensorName, sensorUnit, sensorStateClass, sensorDeviceClass in _sensorDescriptions:
 
         _LOGGER.debug(f"adding Sensor: {sensor} for charger {chargerName}")
-        sensorUnit = _sensorUnits.get(sensor).get('unit') if _sensorUnits.get(sensor) else ''
-        sensorName = _sensorUnits.get(sensor).get('name') if _sensorUnits.get(sensor) else sensor
-        sensorStateClass = _sensorStateClass[sensor] if sensor in _sensorStateClass else ''
-        sensorDeviceClass = _sensorDeviceClass[sensor] if sensor in _sensorDeviceClass else ''
         entities.append(
             GoeChargerSensor(
-                hass.data[DOMAIN]["coordinator"],
+                coordinator,
                 f"sensor.goecharger_{chargerName}_{sensor}",
                 chargerName, sensorName, sensor, sensorUnit, sensorStateClass, sensorDeviceClass
             )
@@ -179,39 +191,41 @@ class GoeChargerSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._chargername = chargerName
         self.entity_id = entity_id
-        self._name = name
-        self._attribute = attribute
-        self._unit = unit
-        self._attr_state_class = stateClass
-        self._attr_device_class = deviceClass
-
-
-    @property
-    def device_info(self):
-        return {
+        self._attr_name = name
+        self._attr_unique_id = f"{chargerName}_{attribute}"
+        self._attr_device_info = {
             "identifiers": {
                 # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._chargername)
+                (DOMAIN, chargerName)
             },
-            "name": self._chargername,
+            "name": chargerName,
             "manufacturer": "go-e",
             "model": "HOME",
         }
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return self._name
-
-    @property
-    def unique_id(self):
-        """Return the unique_id of the sensor."""
-        return f"{self._chargername}_{self._attribute}"
+        self._attribute = attribute
+        self._unit = unit
+        self._attr_state_class = stateClass
+        self._attr_device_class = deviceClass
+        self._state = self._read_state()
+        self._last_written = None
+
+    def _read_state(self):
+        return (self.coordinator.data or {}).get(self._chargername, {}).get(self._attribute)
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write the state only if value or availability changed since the last update."""
+        self._state = self._read_state()
+        current = (self.available, self._state)
+        if current == self._last_written:
+            return
+        self._last_written = current
+        self.async_write_ha_state()
 
     @property
     def state(self):
         """Return the state of the sensor."""
-        return self.coordinator.data[self._chargername][self._attribute]
+        return self._state
 
     @property
     def unit_of_measurement(self):
@@ -1,46 +1,41 @@
 """Platform for go-eCharger switch integration."""
 import logging
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.const import CONF_HOST
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant import core, config_entries
 
-from goecharger import GoeCharger
-
+from . import _async_set_on_chargers
 from .const import DOMAIN, CONF_CHARGERS, CONF_NAME, CHARGER_API
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(
-    hass: core.HomeAssistant,
-    config_entry: config_entries.ConfigEntry,
-    async_add_entities,
-):
-    _LOGGER.debug("setup switch...")
-    _LOGGER.debug(repr(config_entry.as_dict()))
-    config = config_entry.as_dict()["data"]
-
-    chargerName = config[CONF_NAME]
-    host = config[CONF_HOST]
-    chargerApi = GoeCharger(host)
-
-    entities = []
-
+def _create_switches_for_charger(chargerName, hass, goeCharger):
     attribute = "allow_charging"
-    entities.append(
+    return [
         GoeChargerSwitch(
             hass.data[DOMAIN]["coordinator"],
             hass,
-            chargerApi,
+            goeCharger,
             f"switch.goecharger_{chargerName}_{attribute}",
             chargerName,
             "Charging allowed",
             attribute,
         )
-    )
+    ]
 
-    async_add_entities(entities)
+
+async def async_setup_entry(
+    hass: core.HomeAssistant,
+    config_entry: config_entries.ConfigEntry,
+    async_add_entities,
+):
+    _LOGGER.debug("setup switch...")
+    _LOGGER.debug(repr(config_entry.as_dict()))
+    config = config_entry.as_dict()["data"]
+
+    chargerName = config[CONF_NAME]
+    async_add_entities(_create_switches_for_charger(chargerName, hass, hass.data[DOMAIN]["api"][chargerName]))
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
@@ -53,22 +48,10 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     chargerApi = discovery_info[CHARGER_API]
 
     entities = []
-
     for charger in chargers:
         chargerName = charger[0][CONF_NAME]
+        entities.extend(_create_switches_for_charger(chargerName, hass, chargerApi[chargerName]))
 
-        attribute = "allow_charging"
-        entities.append(
-            GoeChargerSwitch(
-                hass.data[DOMAIN]["coordinator"],
-                hass,
-                chargerApi[chargerName],
-                f"switch.goecharger_{chargerName}_{attribute}",
-                chargerName,
-                "Charging allowed",
-                attribute,
-            )
-        )
     async_add_entities(entities)
 
 
@@ -78,45 +61,37 @@ class GoeChargerSwitch(CoordinatorEntity, SwitchEntity):
         super().__init__(coordinator)
         self.entity_id = entity_id
         self._chargername = chargerName
-        self._name = name
-        self._attribute = attribute
-        self.hass = hass
-        self._goeCharger = goeCharger
-        self._state = None
-
-    @property
-    def device_info(self):
-        return {
+        self._attr_name = chargerName
+        self._attr_unique_id = f"{chargerName}_{attribute}"
+        self._attr_device_info = {
             "identifiers": {
                 # Serial numbers are unique identifiers within a specific domain
-                (DOMAIN, self._chargername)
+                (DOMAIN, chargerName)
             },
-            "name": self.name,
+            "name": chargerName,
             "manufacturer": "go-e",
             "model": "HOME",
         }
+        self._attribute = attribute
+        self.hass = hass
+        self._goeCharger = goeCharger
+        self._state = None
+
+    def _read_state(self):
+        return (self.coordinator.data or {}).get(self._chargername, {}).get(self._attribute)
 
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
-        await self.hass.async_add_executor_job(self._goeCharger.setAllowCharging, True)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_allow_charging(True)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
-        await self.hass.async_add_executor_job(self._goeCharger.setAllowCharging, False)
-        await self.coordinator.async_request_refresh()
+        await self._async_set_allow_charging(False)
 
-    @property
-    def name(self):
-        """Return the name of the switch."""
-        return self._chargername
-
-    @property
-    def unique_id(self):
-        """Return the unique_id of the switch."""
-        return f"{self._chargername}_{self._attribute}"
+    async def _async_set_allow_charging(self, allow):
+        await _async_set_on_chargers(self.hass, [self._chargername], "setAllowCharging", allow)
 
     @property
     def is_on(self):
         """Return the state of the switch."""
-        return True if self.coordinator.data[self._chargername][self._attribute] == "on" else False
+        return self._read_state() == "on"